@@ -7,6 +7,7 @@ via the Anthropic API, making it available to all workspace members.
 """
 
 import os
+import shutil
 import sys
 import zipfile
 from pathlib import Path
@@ -50,7 +51,29 @@ def get_skill_directory():
     return skill_dir
 
 
-def validate_skill_structure(skill_dir):
+def collect_skill_files(skill_dir):
+    """Collect relative paths of all packageable files in a single scan"""
+    present = set()
+    stack = [(str(skill_dir), '')]
+
+    while stack:
+        directory, rel = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Skip hidden files/directories, Python cache and bytecode
+                if entry.name.startswith('.') or entry.name == '__pycache__':
+                    continue
+
+                rel_path = f"{rel}/{entry.name}" if rel else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+                elif entry.is_file() and not entry.name.endswith('.pyc'):
+                    present.add(rel_path)
+
+    return present
+
+
+def validate_skill_structure(skill_dir, present=None):
     """Validate that the skill has all required files"""
     required_files = [
         "skills/scalekit-auth/SKILL.md",
@@ -65,12 +88,14 @@ def validate_skill_structure(skill_dir):
         "skills/scalekit-auth/scripts/test_auth_flow.py",
     ]
 
+    if present is None:
+        present = collect_skill_files(skill_dir)
+
     print("Validating skill structure...")
     missing_files = []
 
     for file_path in required_files:
-        full_path = skill_dir / file_path
-        if not full_path.exists():
+        if file_path not in present:
             missing_files.append(file_path)
         else:
             print(f"  ✅ {file_path}")
@@ -86,7 +111,7 @@ def validate_skill_structure(skill_dir):
     return True
 
 
-def create_zip_file(skill_dir):
+def create_zip_file(skill_dir, present=None):
     """Create a temporary zip file of the skill"""
     import tempfile
 
@@ -94,23 +119,23 @@ def create_zip_file(skill_dir):
     zip_path = temp_zip.name
     temp_zip.close()
 
-    print("Creating skill package...")
-
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Add all files except Python cache and system files
-        for root, dirs, files in os.walk(skill_dir):
-            # Skip __pycache__ and hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+    if present is None:
+        present = collect_skill_files(skill_dir)
 
-            for file in files:
-                if file.startswith('.') or file.endswith('.pyc'):
-                    continue
+    print("Creating skill package...")
 
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(skill_dir)
+    # Store entries uncompressed: the skill is mostly small text files, so
+    # deflating them costs more CPU than it saves on upload
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
+        for arcname in sorted(present):
+            file_path = Path(skill_dir) / arcname
 
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+            # Stream each file in 1 MiB chunks instead of reading it whole
+            zipinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            with open(file_path, 'rb') as src, \
+                    zipf.open(zipinfo, 'w', force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            print(f"  Added: {arcname}")
 
     print(f"✅ Package created: {zip_path}")
     print()
@@ -130,8 +155,11 @@ def install_skill(api_key, skill_dir, method='directory'):
     print("✅ Client initialized")
     print()
 
+    # Scan the skill tree once and reuse it for validation and packaging
+    present = collect_skill_files(skill_dir)
+
     # Validate skill structure
-    validate_skill_structure(skill_dir)
+    validate_skill_structure(skill_dir, present)
 
     # Upload skill
     print("Uploading skill to your workspace...")
@@ -148,7 +176,7 @@ def install_skill(api_key, skill_dir, method='directory'):
             )
         else:
             # Upload as zip file
-            zip_path = create_zip_file(skill_dir)
+            zip_path = create_zip_file(skill_dir, present)
             try:
                 with open(zip_path, 'rb') as f:
                     skill = client.beta.skills.create(
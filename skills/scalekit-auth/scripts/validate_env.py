@@ -18,7 +18,18 @@ except ImportError:
     print("   Install with: pip install python-dotenv\n")
 
 
-def check_env_var(var_name, required=True, validate_url=False):
+def parse_url(value):
+    """Parse a URL once so later checks can reuse the result"""
+    if not value:
+        return None
+
+    try:
+        return urlparse(value)
+    except ValueError:
+        return None
+
+
+def check_env_var(var_name, required=True, validate_url=False, parsed=None):
     """Check if environment variable exists and is valid"""
     value = os.getenv(var_name)
 
@@ -33,7 +44,8 @@ def check_env_var(var_name, required=True, validate_url=False):
     # Validate URL format if needed
     if validate_url:
         try:
-            parsed = urlparse(value)
+            if parsed is None:
+                parsed = urlparse(value)
             if not parsed.scheme or not parsed.netloc:
                 print(f"❌ {var_name}: Invalid URL format")
                 print(f"   Value: {value}")
@@ -52,44 +64,44 @@ def check_env_var(var_name, required=True, validate_url=False):
     return True
 
 
-def validate_scalekit_url(url):
+def validate_scalekit_url(parsed):
     """Validate Scalekit environment URL format"""
-    if not url:
+    if not parsed:
         return False
 
-    parsed = urlparse(url)
+    host = parsed.hostname or ""
 
     # Check for common mistakes
-    if "localhost" in url.lower():
+    if "localhost" in host:
         print("\n⚠️  Warning: Using localhost in SCALEKIT_ENVIRONMENT_URL")
         print("   This should be your Scalekit environment URL from the dashboard")
         return False
 
-    if not url.startswith("https://"):
+    if parsed.scheme != "https":
         print("\n⚠️  Warning: SCALEKIT_ENVIRONMENT_URL should use HTTPS")
         return False
 
-    if "scalekit.com" not in url.lower():
-        print("\n⚠️  Warning: URL doesn't contain 'scalekit.com'")
+    if host != "scalekit.com" and not host.endswith(".scalekit.com"):
+        print("\n⚠️  Warning: URL host isn't a 'scalekit.com' domain")
         print("   Expected format: https://your-env.scalekit.com")
         return False
 
     return True
 
 
-def validate_callback_url(callback_url, app_url):
+def validate_callback_url(parsed, app_parsed):
     """Validate callback URL configuration"""
-    if not callback_url:
+    if not parsed:
         return False
 
     # Check that callback URL is absolute
-    parsed = urlparse(callback_url)
     if not parsed.scheme or not parsed.netloc:
         print("\n❌ CALLBACK_URL must be an absolute URL (include http:// or https://)")
         return False
 
     # Warn about localhost in production
-    if "localhost" not in app_url and "localhost" in callback_url:
+    app_host = app_parsed.hostname if app_parsed else None
+    if app_host != "localhost" and parsed.hostname == "localhost":
         print("\n⚠️  Warning: Callback URL uses localhost but APP_URL doesn't")
         print("   Make sure this matches your Scalekit Dashboard configuration")
 
@@ -109,15 +121,16 @@ def main():
     print("-" * 40)
 
     env_url = os.getenv("SCALEKIT_ENVIRONMENT_URL")
-    all_valid &= check_env_var("SCALEKIT_ENVIRONMENT_URL", required=True, validate_url=True)
+    env_parsed = parse_url(env_url)
+    all_valid &= check_env_var("SCALEKIT_ENVIRONMENT_URL", required=True, validate_url=True, parsed=env_parsed)
     all_valid &= check_env_var("SCALEKIT_CLIENT_ID", required=True)
     all_valid &= check_env_var("SCALEKIT_CLIENT_SECRET", required=True)
 
     print()
 
     # Additional URL validation
-    if env_url:
-        if not validate_scalekit_url(env_url):
+    if env_parsed:
+        if not validate_scalekit_url(env_parsed):
             all_valid = False
 
     # Check application URLs
@@ -126,16 +139,18 @@ def main():
 
     app_url = os.getenv("APP_URL", "")
     callback_url = os.getenv("CALLBACK_URL", "")
+    app_parsed = parse_url(app_url)
+    cb_parsed = parse_url(callback_url)
 
-    all_valid &= check_env_var("APP_URL", required=False, validate_url=True)
-    all_valid &= check_env_var("CALLBACK_URL", required=True, validate_url=True)
+    all_valid &= check_env_var("APP_URL", required=False, validate_url=True, parsed=app_parsed)
+    all_valid &= check_env_var("CALLBACK_URL", required=True, validate_url=True, parsed=cb_parsed)
     all_valid &= check_env_var("POST_LOGOUT_URL", required=False, validate_url=True)
 
     print()
 
     # Validate callback URL
-    if callback_url:
-        if not validate_callback_url(callback_url, app_url):
+    if cb_parsed:
+        if not validate_callback_url(cb_parsed, app_parsed):
             all_valid = False
 
     # Check optional settings
@@ -145,7 +160,8 @@ def main():
     cookie_secure = os.getenv("COOKIE_SECURE", "false")
     print(f"{'✅' if cookie_secure else '⚠️ '} COOKIE_SECURE: {cookie_secure}")
 
-    if cookie_secure.lower() == "false" and callback_url and "https://" in callback_url and "localhost" not in callback_url:
+    if (cookie_secure.lower() == "false" and cb_parsed
+            and cb_parsed.scheme == "https" and cb_parsed.hostname != "localhost"):
         print("   ⚠️  Warning: Using HTTPS but COOKIE_SECURE is false")
         print("   Consider setting COOKIE_SECURE=true for production")
 